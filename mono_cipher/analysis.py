@@ -1,8 +1,13 @@
 """Heuristics for monoalphabetic substitution ciphertexts (frequency + hill-climb search)."""
 
+import math
+import multiprocessing
+import os
 import random
 from collections import Counter
-from typing import Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
 
 from . import cipher
 
@@ -17,15 +22,29 @@ ENGLISH_FREQ = [
     ("Q", 0.00095), ("Z", 0.00074),
 ]
 
+# ENGLISH_FREQ letters only, most frequent first
+_ENGLISH_ORDER = "".join(letter for letter, _ in ENGLISH_FREQ)
+
 COMMON_WORDS = [
     " the ", " and ", " to ", " of ", " that ", " is ", " in ", " it ",
     " for ", " you ", " with ", " on ", " have ", " be ", " as ", " at "
 ]
 
+# Source side of the hill-climb translate tables (both cases, A-Z order)
+_CIPHER_CHARS = cipher.ALPHABET + cipher.ALPHABET.lower()
+
+# Letters english_score rewards one point each
+_COMMON_LETTERS = b"etaoinshrdlu"
+
+
+# Byte tables for _letters_only: uppercase a-z, drop every other byte (C-level pass)
+_UPPER_TABLE = bytes.maketrans(cipher.ALPHABET.lower().encode("ascii"), cipher.ALPHABET.encode("ascii"))
+_NON_LETTERS = bytes(b for b in range(256) if not (65 <= b <= 90 or 97 <= b <= 122))
+
 
 def _letters_only(text: str) -> str:
-    """Returns only alphabetic characters uppercased."""
-    return "".join([c for c in text.upper() if c.isalpha()])
+    """Returns only A-Z letters uppercased (non-ASCII characters are dropped)."""
+    return text.encode("ascii", "ignore").translate(_UPPER_TABLE, _NON_LETTERS).decode("ascii")
 
 
 def letter_frequency(ciphertext: str) -> List[Tuple[str, float]]:
@@ -44,17 +63,20 @@ def guess_mapping_by_frequency(ciphertext: str) -> Dict[str, str]:
     Builds a cipher->plain mapping by aligning ciphertext letter frequencies
     with English letter frequencies (highest to highest).
     """
-    cipher_freq = letter_frequency(ciphertext)
-    english_sorted = [letter for letter, _ in ENGLISH_FREQ]
+    return _mapping_from_frequency(letter_frequency(ciphertext))
+
+
+def _mapping_from_frequency(cipher_freq: List[Tuple[str, float]]) -> Dict[str, str]:
+    """Same as guess_mapping_by_frequency, from an already computed letter_frequency list."""
     mapping: Dict[str, str] = {}
 
-    for idx, (cipher_ch, _) in enumerate(cipher_freq):
-        if idx < len(english_sorted):
-            mapping[cipher_ch] = english_sorted[idx]
+    for (cipher_ch, _), plain in zip(cipher_freq, _ENGLISH_ORDER):
+        mapping[cipher_ch] = plain
 
-    # For any missing letters (unlikely), map them to remaining English letters
-    remaining_plain = [ch for ch in english_sorted if ch not in mapping.values()]
-    remaining_cipher = [ch for ch in (chr(ord("A") + i) for i in range(26)) if ch not in mapping]
+    # For any missing letters (unlikely), map them to remaining English letters.
+    # Plain letters were handed out in _ENGLISH_ORDER order, so the rest is a suffix.
+    remaining_plain = _ENGLISH_ORDER[len(mapping):]
+    remaining_cipher = [ch for ch in cipher.ALPHABET if ch not in mapping]
     for c, p in zip(remaining_cipher, remaining_plain):
         mapping[c] = p
 
@@ -68,22 +90,21 @@ def mapping_to_key(mapping: Dict[str, str]) -> str:
     """
     inverse = {plain: cipher_ch for cipher_ch, plain in mapping.items()}
     key_chars = []
-    for plain in (chr(ord("A") + i) for i in range(26)):
+    for plain in cipher.ALPHABET:
         key_chars.append(inverse.get(plain, plain))
     return "".join(key_chars)
 
 
+def _mapping_table(mapping: Dict[str, str]) -> Dict[int, int]:
+    """Builds a str.translate table for a cipher->plain mapping, preserving case."""
+    cipher_chars = "".join(mapping)
+    plain_chars = "".join(mapping.values())
+    return str.maketrans(cipher_chars + cipher_chars.lower(), plain_chars + plain_chars.lower())
+
+
 def apply_mapping(ciphertext: str, mapping: Dict[str, str]) -> str:
     """Applies a cipher->plain mapping directly to produce a plaintext guess."""
-    result = []
-    for ch in ciphertext:
-        if ch.isalpha():
-            upper = ch.upper()
-            plain = mapping.get(upper, upper)
-            result.append(plain if ch.isupper() else plain.lower())
-        else:
-            result.append(ch)
-    return "".join(result)
+    return ciphertext.translate(_mapping_table(mapping))
 
 
 def english_score(text: str) -> int:
@@ -94,8 +115,10 @@ def english_score(text: str) -> int:
     score = 0
     for word in COMMON_WORDS:
         score += lower.count(word) * 10
-    freq = {char: lower.count(char) for char in "etaoinshrdlu"}
-    score += sum(freq.values())
+    # Count all of "etaoinshrdlu" in one pass: bytes deleted by translate.
+    # Only ASCII letters count, so dropping the rest (incl. lone surrogates) is safe.
+    raw = lower.encode("ascii", "ignore")
+    score += len(raw) - len(raw.translate(None, _COMMON_LETTERS))
     return score
 
 
@@ -109,44 +132,86 @@ def _swap_mapping(mapping: Dict[str, str], a: str, b: str) -> Dict[str, str]:
     return new_map
 
 
-def _hill_climb(ciphertext: str, initial_map: Dict[str, str], max_iter: int = 2000, stagnation: int = 400) -> Tuple[int, Dict[str, str], str]:
+def _mapping_to_perm(mapping: Dict[str, str]) -> List[str]:
+    """Flattens a cipher->plain mapping into a 26-entry list indexed by cipher letter (A=0)."""
+    return [mapping.get(c, c) for c in cipher.ALPHABET]
+
+
+def _apply_perm(ciphertext: str, perm: List[str]) -> str:
+    """apply_mapping for the list form used inside the hill-climb."""
+    plain_chars = "".join(perm)
+    return ciphertext.translate(str.maketrans(_CIPHER_CHARS, plain_chars + plain_chars.lower()))
+
+
+def _hill_climb(ciphertext: str, initial_map: Dict[str, str], max_iter: int = 1200, stagnation: int = 250,
+                rng: Optional[random.Random] = None, temperature: float = 1.5,
+                cooling: float = 0.9995) -> Tuple[int, Dict[str, str], str]:
     """
-    Simple hill-climb: random swaps that improve english_score are accepted.
+    Hill-climb with a simulated-annealing kick: improving swaps are always
+    accepted, worse ones with probability exp(delta / T), equal-score ones
+    never (drifting across plateaus measurably hurt results). T cools
+    geometrically each step and is reset whenever a new best is found; the
+    search stops after `stagnation` steps without a new best.
+    The mapping is kept as a 26-entry list while searching (a swap is two stores).
     Returns (score, mapping, plaintext).
     """
-    best_map = initial_map
-    best_plain = apply_mapping(ciphertext, best_map)
+    if rng is None:
+        rng = random
+    best_perm = _mapping_to_perm(initial_map)
+    best_plain = _apply_perm(ciphertext, best_perm)
     best_score = english_score(best_plain)
 
-    current_map = best_map
+    current_perm = best_perm
     current_score = best_score
+    temp = temperature
     steps_since_improve = 0
+    # Swapping two letters that never occur in the ciphertext cannot change the plaintext
+    used = set(_letters_only(ciphertext))
+    present = [c in used for c in cipher.ALPHABET]
 
     for _ in range(max_iter):
-        c1, c2 = random.sample(cipher.ALPHABET, 2)
-        cand_map = _swap_mapping(current_map, c1, c2)
-        cand_plain = apply_mapping(ciphertext, cand_map)
+        # Two distinct indices without allocating a sample list
+        i = rng.randrange(26)
+        j = rng.randrange(25)
+        if j >= i:
+            j += 1
+        if not (present[i] or present[j]):
+            continue
+        cand_perm = current_perm.copy()
+        cand_perm[i], cand_perm[j] = cand_perm[j], cand_perm[i]
+        cand_plain = _apply_perm(ciphertext, cand_perm)
         cand_score = english_score(cand_plain)
-        if cand_score > current_score:
-            current_map = cand_map
+        delta = cand_score - current_score
+        if delta > 0 or (delta < 0 and rng.random() < math.exp(delta / temp)):
+            current_perm = cand_perm
             current_score = cand_score
+        if cand_score > best_score:
+            best_perm = cand_perm
+            best_plain = cand_plain
+            best_score = cand_score
+            temp = temperature
             steps_since_improve = 0
-            if cand_score > best_score:
-                best_map = cand_map
-                best_plain = cand_plain
-                best_score = cand_score
         else:
+            temp *= cooling
             steps_since_improve += 1
             if steps_since_improve >= stagnation:
                 break
-    return best_score, best_map, best_plain
+    return best_score, dict(zip(cipher.ALPHABET, best_perm)), best_plain
+
+
+def _hill_climb_worker(job: Tuple[str, Dict[str, str], int]) -> Tuple[int, str, str]:
+    """Runs one seeded hill-climb restart (process-pool entry point). Returns (score, key, plaintext)."""
+    ciphertext, seed, rng_seed = job
+    score, mapping, plaintext = _hill_climb(ciphertext, seed, rng=random.Random(rng_seed))
+    return score, mapping_to_key(mapping), plaintext
 
 
 def _seed_mappings(ciphertext: str) -> List[Dict[str, str]]:
     """Builds a handful of seed mappings by swapping among top-frequency cipher letters."""
-    base = guess_mapping_by_frequency(ciphertext)
+    cipher_freq = letter_frequency(ciphertext)
+    base = _mapping_from_frequency(cipher_freq)
     seeds = [base]
-    top_cipher = [ch for ch, _ in letter_frequency(ciphertext)][:6]
+    top_cipher = [ch for ch, _ in cipher_freq][:6]
     swap_pairs = [(a, b) for idx, a in enumerate(top_cipher) for b in top_cipher[idx + 1:]]
     random.shuffle(swap_pairs)
     for a, b in swap_pairs[:6]:  # limit seed explosion
@@ -154,22 +219,42 @@ def _seed_mappings(ciphertext: str) -> List[Dict[str, str]]:
     return seeds
 
 
-def bruteforce(ciphertext: str, restarts_per_seed: int = 3, top: int = 5) -> List[Tuple[int, str, str]]:
+def bruteforce(ciphertext: str, restarts_per_seed: int = 3, top: int = 5,
+               workers: Optional[int] = None) -> List[Tuple[int, str, str]]:
     """
     Frequency seeding + hill-climb refinement.
 
+    Restarts are independent, so they run in a process pool (`workers`
+    processes, default one per CPU). With workers=1 (or a single CPU) they
+    run in-process.
+
     Returns:
         List of (score, key, plaintext) sorted by score desc.
     """
     if not ciphertext:
         return []
 
+    # Each restart gets its own RNG seed, drawn here so runs stay reproducible under random.seed()
+    jobs = [
+        (ciphertext, seed, random.getrandbits(32))
+        for seed in _seed_mappings(ciphertext)
+        for _ in range(restarts_per_seed)
+    ]
+    if workers is None:
+        workers = os.cpu_count() or 1
     results: List[Tuple[int, str, str]] = []
-    for seed in _seed_mappings(ciphertext):
-        for _ in range(restarts_per_seed):
-            score, mapping, plaintext = _hill_climb(ciphertext, seed)
-            key = mapping_to_key(mapping)
-            results.append((score, key, plaintext))
+    if workers > 1:
+        # Never fork: callers (brute_flow's Spinner) may have threads holding stdout's lock.
+        # forkserver/spawn start workers from a fresh interpreter instead.
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method)) as executor:
+                results = list(executor.map(_hill_climb_worker, jobs))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # No usable process pool on this platform/sandbox; fall back to serial
+            results = []
+    if not results:
+        results = [_hill_climb_worker(job) for job in jobs]
 
     # Deduplicate by key while keeping highest score per key
     best_by_key: Dict[str, Tuple[int, str]] = {}
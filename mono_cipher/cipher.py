@@ -1,9 +1,21 @@
 """Core monoalphabetic substitution cipher logic."""
 
+import queue
 import string
-from typing import Dict, List
+import threading
+from functools import lru_cache
+from typing import IO, AnyStr, Dict, List, Optional, Tuple
 
 ALPHABET = string.ascii_uppercase
+# Both cases, A-Z then a-z: the source side of every translate table
+_LETTERS = ALPHABET + ALPHABET.lower()
+_LETTERS_BYTES = _LETTERS.encode("ascii")
+_ALL_LETTERS_MASK = (1 << 26) - 1
+
+# Chunk size for the streaming helpers (fits comfortably in L2)
+CHUNK_SIZE = 64 * 1024
+# Chunks buffered between pipeline stages in the streaming helpers
+_PIPELINE_DEPTH = 4
 
 
 def _normalize_key(key: str) -> List[str]:
@@ -13,22 +25,57 @@ def _normalize_key(key: str) -> List[str]:
     The key must contain exactly 26 alphabetic characters, covering every letter
     exactly once (case-insensitive). Returns the key as an uppercase list of
     length 26 aligned with A-Z.
+
+    Validation is a single pass: each letter sets its bit in a 26-bit mask, so
+    26 letters cover every letter exactly when the mask is full.
     """
-    letters = [ch for ch in key if ch.isalpha()]
+    letters = []
+    seen = 0
+    for ch in key:
+        idx = (ord(ch) | 0x20) - 97  # folds A-Z onto a-z; only letters land in 0..25
+        if 0 <= idx < 26:
+            letters.append(ALPHABET[idx])
+            seen |= 1 << idx
+        elif ch.isalpha():
+            raise ValueError("Key must only use the letters A-Z.")
     if len(letters) != 26:
         raise ValueError("Key must contain exactly 26 alphabetic characters.")
-    letters = [ch.upper() for ch in letters]
-    if len(set(letters)) != 26:
+    if seen != _ALL_LETTERS_MASK:
         raise ValueError("Key must not contain duplicate letters.")
     return letters
 
 
-def _build_maps(key: str) -> Dict[str, Dict[str, str]]:
-    """Builds forward and inverse maps for substitution."""
-    normalized = _normalize_key(key)
-    forward = {plain: subst for plain, subst in zip(ALPHABET, normalized)}
-    inverse = {subst: plain for plain, subst in forward.items()}
-    return {"forward": forward, "inverse": inverse}
+@lru_cache(maxsize=1024)
+def _build_maps(key: str) -> Dict[str, Tuple[Dict[int, int], bytes]]:
+    """
+    Builds forward and inverse substitution tables, each as a
+    (str.translate table, 256-byte bytes.translate table) pair.
+    Both cases are mapped; every other character passes through unchanged.
+    Cached per key, so repeated calls skip validation and table building.
+    """
+    normalized = "".join(_normalize_key(key))
+    subst = normalized + normalized.lower()
+    subst_b = subst.encode("ascii")
+    return {
+        "forward": (str.maketrans(_LETTERS, subst), bytes.maketrans(_LETTERS_BYTES, subst_b)),
+        "inverse": (str.maketrans(subst, _LETTERS), bytes.maketrans(subst_b, _LETTERS_BYTES)),
+    }
+
+
+def _substitute(text: AnyStr, tables: Tuple[Dict[int, int], bytes]) -> AnyStr:
+    """
+    Applies a table pair from _build_maps to str or bytes.
+
+    str.translate falls back to a slow per-character path on non-ASCII strings,
+    so those go through UTF-8 bytes instead (~10x faster). Multibyte UTF-8
+    sequences contain no ASCII bytes, so only the letters A-Z/a-z change.
+    """
+    str_table, byte_table = tables
+    if isinstance(text, bytes):
+        return text.translate(byte_table)
+    if text.isascii():
+        return text.translate(str_table)
+    return text.encode("utf-8", "surrogatepass").translate(byte_table).decode("utf-8", "surrogatepass")
 
 
 def encrypt(plaintext: str, key: str) -> str:
@@ -42,16 +89,7 @@ def encrypt(plaintext: str, key: str) -> str:
     Returns:
         Encrypted ciphertext.
     """
-    maps = _build_maps(key)["forward"]
-    result = []
-    for ch in plaintext:
-        if ch.isalpha():
-            upper = ch.upper()
-            subst = maps[upper]
-            result.append(subst if ch.isupper() else subst.lower())
-        else:
-            result.append(ch)
-    return "".join(result)
+    return _substitute(plaintext, _build_maps(key)["forward"])
 
 
 def decrypt(ciphertext: str, key: str) -> str:
@@ -65,16 +103,98 @@ def decrypt(ciphertext: str, key: str) -> str:
     Returns:
         Decrypted plaintext.
     """
-    maps = _build_maps(key)["inverse"]
-    result = []
-    for ch in ciphertext:
-        if ch.isalpha():
-            upper = ch.upper()
-            plain = maps[upper]
-            result.append(plain if ch.isupper() else plain.lower())
-        else:
-            result.append(ch)
-    return "".join(result)
+    return _substitute(ciphertext, _build_maps(key)["inverse"])
+
+
+def _translate_stream(src: IO[AnyStr], dst: IO[AnyStr], tables: Tuple[Dict[int, int], bytes], chunk_size: int) -> int:
+    """
+    Copies src to dst through _substitute as a three-stage pipeline: a reader
+    thread, translation in the calling thread, and a writer thread, joined by
+    bounded queues so file I/O overlaps translation and only a few chunks are
+    ever in memory. Returns characters (or bytes) written; re-raises reader/writer errors.
+    """
+    read_q: "queue.Queue[Optional[AnyStr]]" = queue.Queue(maxsize=_PIPELINE_DEPTH)
+    write_q: "queue.Queue[Optional[AnyStr]]" = queue.Queue(maxsize=_PIPELINE_DEPTH)
+    errors: List[BaseException] = []
+
+    def reader():
+        try:
+            while not errors:
+                chunk = src.read(chunk_size)
+                if not chunk:
+                    break
+                read_q.put(chunk)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            read_q.put(None)
+
+    def writer():
+        while True:
+            chunk = write_q.get()
+            if chunk is None:
+                return
+            if errors:
+                continue  # keep draining so the translate stage never blocks
+            try:
+                dst.write(chunk)
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=reader, daemon=True), threading.Thread(target=writer, daemon=True)]
+    for thread in threads:
+        thread.start()
+    total = 0
+    while True:
+        chunk = read_q.get()
+        if chunk is None:
+            break
+        if not errors:
+            write_q.put(_substitute(chunk, tables))
+            total += len(chunk)
+    write_q.put(None)
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return total
+
+
+def encrypt_stream(src: IO[AnyStr], dst: IO[AnyStr], key: str, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Encrypts text read from src and writes it to dst without holding it all in memory.
+    Substitution works per character, so chunk boundaries don't matter.
+
+    Binary file objects are substituted byte-wise with no decoding at all, which
+    is correct for UTF-8 and other ASCII-compatible encodings.
+
+    Args:
+        src: Readable text or binary file object (plaintext).
+        dst: Writable file object of the same kind (ciphertext).
+        key: A 26-letter substitution alphabet (e.g., QWERTY...).
+        chunk_size: Characters (or bytes) read per chunk.
+
+    Returns:
+        Number of characters (or bytes) processed.
+    """
+    return _translate_stream(src, dst, _build_maps(key)["forward"], chunk_size)
+
+
+def decrypt_stream(src: IO[AnyStr], dst: IO[AnyStr], key: str, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Decrypts text read from src and writes it to dst without holding it all in memory.
+    Accepts text or binary file objects, like encrypt_stream.
+
+    Args:
+        src: Readable text or binary file object (ciphertext).
+        dst: Writable file object of the same kind (plaintext).
+        key: The same 26-letter substitution alphabet used for encryption.
+        chunk_size: Characters (or bytes) read per chunk.
+
+    Returns:
+        Number of characters (or bytes) processed.
+    """
+    return _translate_stream(src, dst, _build_maps(key)["inverse"], chunk_size)
 
 
 def validate_key(key: str) -> bool:
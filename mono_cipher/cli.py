@@ -1,16 +1,24 @@
 #!/usr/bin/env python3
 """
 Command-line entry point for the monoalphabetic substitution cipher app.
+
+Without arguments it starts the interactive menu. With a key it works as a
+filter (stdin -> stdout) and never imports the UI layer (pyfiglet, colorama,
+pyperclip), keeping `cat file | mono-cipher KEY` startup cheap.
 """
 
+import argparse
+import os
 import sys
 import time
 
-from . import ui, workflows
+from . import cipher
 
 
 def main_loop():
     """The main menu loop of the application."""
+    from . import ui, workflows
+
     while True:
         ui.clear()
         ui.banner()
@@ -41,11 +49,46 @@ def main_loop():
             time.sleep(0.8)
 
 
+def filter_mode(argv) -> int:
+    """
+    Non-interactive mode: encrypts (or decrypts with -d) stdin to stdout with the given key.
+    Streams raw bytes in chunks: no decoding, and input size is not limited by memory.
+    """
+    parser = argparse.ArgumentParser(
+        prog="mono-cipher",
+        description="Mono alphabetic substitution cipher. Run without arguments for the interactive menu.",
+    )
+    parser.add_argument("key", help="26-letter substitution alphabet, e.g. QWERTYUIOPASDFGHJKLZXCVBNM")
+    parser.add_argument("-d", "--decrypt", action="store_true", help="decrypt instead of encrypt")
+    args = parser.parse_args(argv)
+    try:
+        cipher.validate_key(args.key)
+    except ValueError as e:
+        parser.error(str(e))
+
+    stream = cipher.decrypt_stream if args.decrypt else cipher.encrypt_stream
+    try:
+        stream(sys.stdin.buffer, sys.stdout.buffer, args.key)
+        sys.stdout.buffer.flush()
+    except BrokenPipeError:
+        # Reader went away (e.g. `| head`); silence the flush at interpreter exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    return 0
+
+
 def main():
     """Main function to run the application."""
+    if len(sys.argv) > 1:
+        try:
+            sys.exit(filter_mode(sys.argv[1:]))
+        except KeyboardInterrupt:
+            sys.exit(130)
+
     try:
         main_loop()
     except KeyboardInterrupt:
+        from . import ui
         print("\n" + ui.FG["magenta"] + "Thoát." + ui.RESET)
         sys.exit(0)
 
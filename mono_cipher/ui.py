@@ -2,6 +2,7 @@
 
 import os
 import shutil
+import signal
 import sys
 import threading
 import time
@@ -38,11 +39,34 @@ FG = {
 }
 
 
+# Terminal width cache, invalidated on SIGWINCH (POSIX only; elsewhere we query every time)
+_CACHED_WIDTH = [None]
+
+
+def _invalidate_width(*_):
+    """SIGWINCH handler: forget the cached width so the next call re-queries it."""
+    _CACHED_WIDTH[0] = None
+
+
+_CACHE_WIDTH = hasattr(signal, "SIGWINCH")
+if _CACHE_WIDTH:
+    try:
+        signal.signal(signal.SIGWINCH, _invalidate_width)
+    except ValueError:
+        # Not imported from the main thread; signal handlers can't be installed
+        _CACHE_WIDTH = False
+
+
 # --- UI Utilities ---
 
 def get_terminal_width() -> int:
-    """Gets the current terminal width."""
-    return shutil.get_terminal_size((80, 20)).columns
+    """Gets the current terminal width (cached until the terminal is resized)."""
+    if _CACHE_WIDTH and _CACHED_WIDTH[0] is not None:
+        return _CACHED_WIDTH[0]
+    width = shutil.get_terminal_size((80, 20)).columns
+    if _CACHE_WIDTH:
+        _CACHED_WIDTH[0] = width
+    return width
 
 
 def clear():
@@ -2,24 +2,93 @@
 Application workflows that orchestrate the UI and monoalphabetic cipher logic.
 """
 
+import os
 import sys
 from typing import Optional
 from . import ui
 from . import cipher
 from . import analysis
 
+# Colour codes looked up once; the helpers below wrap a message in one of them
+_RED, _GREEN, _YELLOW, _CYAN = ui.FG["red"], ui.FG["green"], ui.FG["yellow"], ui.FG["cyan"]
+_RESET = ui.RESET
+
+# Results longer than this are shown as head + tail only (save to file for the full text)
+_PREVIEW_LIMIT = 4096
+_PREVIEW_HEAD = 2048
+_PREVIEW_TAIL = 512
+
+
+def _err(msg: str) -> str:
+    """Wraps msg in red (errors)."""
+    return f"{_RED}{msg}{_RESET}"
+
+
+def _ok(msg: str) -> str:
+    """Wraps msg in green (success)."""
+    return f"{_GREEN}{msg}{_RESET}"
+
+
+def _warn(msg: str) -> str:
+    """Wraps msg in yellow (warnings/hints)."""
+    return f"{_YELLOW}{msg}{_RESET}"
+
+
+def _info(msg: str) -> str:
+    """Wraps msg in cyan (menus)."""
+    return f"{_CYAN}{msg}{_RESET}"
+
 
 def _strip_saved_header(text: str) -> str:
     """
     Removes the single-line header we add when saving (e.g., 'Plaintext | Key: ...')
     so reusing a saved file won't accidentally re-process the header.
     """
-    lines = text.splitlines()
-    if lines and "key:" in lines[0].lower():
-        lines = lines[1:]
-        while lines and not lines[0].strip():
-            lines = lines[1:]
-    return "\n".join(lines)
+    nl = text.find("\n")
+    first = text if nl == -1 else text[:nl]
+    if "key:" not in first.lower():
+        return text
+    if nl == -1:
+        return ""
+    # Skip blank lines after the header, then slice once (no split/join copies)
+    start = nl + 1
+    while True:
+        nl = text.find("\n", start)
+        if text[start:len(text) if nl == -1 else nl].strip():
+            return text[start:]
+        if nl == -1:
+            return ""
+        start = nl + 1
+
+
+def _decode_text(raw: bytes, encoding: str = "utf-8", errors: str = "strict") -> str:
+    """Decodes raw input once and normalizes newlines to '\n' like text-mode I/O would."""
+    text = raw.decode(encoding, errors)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _read_file(path: str) -> str:
+    """
+    Reads a UTF-8 text file into one buffer sized from the file's stat, then
+    decodes once (instead of letting buffered text I/O grow and copy).
+    The file is opened unbuffered, so the OS reads land directly in that buffer.
+    """
+    with open(path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        buf = bytearray(size)
+        n = 0
+        with memoryview(buf) as view:
+            while n < size:
+                got = f.readinto(view[n:])
+                if not got:
+                    break
+                n += got
+        del buf[n:]
+        # Anything beyond st_size (file grew, or a pipe/procfs file reporting 0)
+        buf += f.readall()
+    return _decode_text(buf)
 
 
 def _read_text_input(label: str) -> str:
@@ -27,25 +96,43 @@ def _read_text_input(label: str) -> str:
     Reads potentially large text either from stdin (if piped), a file, or direct input.
     """
     if not sys.stdin.isatty():
-        data = sys.stdin.read()
+        # Read raw bytes and decode in one go rather than through the text layer
+        data = _decode_text(sys.stdin.buffer.read(), sys.stdin.encoding or "utf-8", sys.stdin.errors or "strict")
         return _strip_saved_header(data.rstrip("\n"))
 
-    print(ui.FG["yellow"] + "Văn bản dài (trên ~1k ký tự) nên nhập qua file để tránh bị cắt." + ui.RESET)
+    print(_warn("Văn bản dài (trên ~1k ký tự) nên nhập qua file để tránh bị cắt."))
     mode = ui.prompt("Chọn nhập trực tiếp [Enter] hoặc gõ 'f' để đọc từ file: ").strip().lower()
     if mode == "f":
         while True:
             path = ui.prompt("Đường dẫn file: ").strip()
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    return _strip_saved_header(f.read())
+                text = _read_file(path)
+                # Drop exactly one trailing newline (the file's line terminator), keep blank lines
+                if text.endswith("\n"):
+                    text = text[:-1]
+                return _strip_saved_header(text)
             except Exception as e:
-                print(ui.FG["red"] + f"Lỗi đọc file: {e}" + ui.RESET)
+                print(_err(f"Lỗi đọc file: {e}"))
                 retry = ui.prompt("Thử lại? (y/n): ").strip().lower()
                 if retry != "y":
                     return ""
     return ui.prompt(f"{label}: ")
 
 
+def _preview(text: str) -> str:
+    """
+    Shortens long results for ui.boxed so rendering stays instant regardless of size.
+    Short text is returned unchanged.
+    """
+    if len(text) <= _PREVIEW_LIMIT:
+        return text
+    return (
+        f"{text[:_PREVIEW_HEAD]}\n"
+        f"… (tổng {len(text)} ký tự, đã rút gọn — lưu file để xem đầy đủ) …\n"
+        f"{text[-_PREVIEW_TAIL:]}"
+    )
+
+
 def _read_key() -> str:
     """
     Prompts for a 26-letter substitution alphabet.
@@ -57,7 +144,7 @@ def _read_key() -> str:
             cipher.validate_key(key)
             return key
         except ValueError as e:
-            print(ui.FG["red"] + f"Khóa không hợp lệ: {e}" + ui.RESET)
+            print(_err(f"Khóa không hợp lệ: {e}"))
 
 
 def encrypt_flow():
@@ -68,7 +155,7 @@ def encrypt_flow():
     plaintext = _read_text_input("Plaintext")
     key = _read_key()
     ciphertext = cipher.encrypt(plaintext, key)
-    ui.boxed("KẾT QUẢ", ciphertext)
+    ui.boxed("KẾT QUẢ", _preview(ciphertext))
     post_output_actions(ciphertext, key=key, label="Ciphertext")
 
 
@@ -80,7 +167,7 @@ def decrypt_flow():
     ciphertext = _read_text_input("Ciphertext")
     key = _read_key()
     plaintext = cipher.decrypt(ciphertext, key)
-    ui.boxed("KẾT QUẢ", plaintext)
+    ui.boxed("KẾT QUẢ", _preview(plaintext))
     post_output_actions(plaintext, key=key, label="Plaintext")
 
 
@@ -97,7 +184,7 @@ def brute_flow():
 
 
     if not results:
-        print(ui.FG["red"] + "Không tìm được kết quả." + ui.RESET)
+        print(_err("Không tìm được kết quả."))
         ui.prompt("Nhấn Enter để về menu...")
         return
     
@@ -110,7 +197,7 @@ def brute_flow():
     best_score, guessed_key, plaintext_guess = results[0]
     body = (
         f"Top ứng viên (score giảm dần):\n{summary}\n\n"
-        f"Best guess (score {best_score}):\nKey: {guessed_key}\n\n{plaintext_guess}"
+        f"Best guess (score {best_score}):\nKey: {guessed_key}\n\n{_preview(plaintext_guess)}"
     )
     ui.boxed("KẾT QUẢ", body)
     post_output_actions(plaintext_guess, key=guessed_key, label="Plaintext Guess")
@@ -122,33 +209,35 @@ def post_output_actions(text: str, key: Optional[str] = None, label: str = ""):
     When saving to file, the key (if provided) is written alongside the output.
     """
     print()
-    print(ui.FG["cyan"] + "[1] Copy vào clipboard (nếu có pyperclip)   [2] Lưu vào file   [Enter] Quay lại" + ui.RESET)
+    print(_info("[1] Copy vào clipboard (nếu có pyperclip)   [2] Lưu vào file   [Enter] Quay lại"))
     cmd = ui.prompt("Chọn: ").strip()
     if cmd == "1":
         if ui.pyperclip:
             try:
                 ui.pyperclip.copy(text)
-                print(ui.FG["green"] + "Đã copy vào clipboard." + ui.RESET)
+                print(_ok("Đã copy vào clipboard."))
             except Exception as e:
-                print(ui.FG["red"] + f"Copy thất bại: {e}" + ui.RESET)
+                print(_err(f"Copy thất bại: {e}"))
         else:
-            print(ui.FG["yellow"] + "pyperclip không cài, không thể copy. Bạn có thể pip install pyperclip." + ui.RESET)
+            print(_warn("pyperclip không cài, không thể copy. Bạn có thể pip install pyperclip."))
     elif cmd == "2":
         fname = ui.prompt("Tên file lưu (mặc định output.txt): ").strip() or "output.txt"
-        content = text
+        header = None
         if key is not None:
             header_parts = []
             if label:
                 header_parts.append(label)
             header_parts.append(f"Key: {key}")
             header = " — ".join(header_parts)
-            content = f"{header}\n\n{text}"
         try:
             with open(fname, "w", encoding="utf-8") as f:
-                f.write(content)
-            print(ui.FG["green"] + f"Đã lưu vào {fname}" + ui.RESET)
+                # Separate writes: prefixing the header would copy the whole text
+                if header is not None:
+                    f.write(f"{header}\n\n")
+                f.write(text)
+            print(_ok(f"Đã lưu vào {fname}"))
         except Exception as e:
-            print(ui.FG["red"] + f"Lưu thất bại: {e}" + ui.RESET)
+            print(_err(f"Lưu thất bại: {e}"))
     else:
         return
     ui.prompt("Nhấn Enter để tiếp tục...")